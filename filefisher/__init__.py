@@ -1,9 +1,12 @@
 # flake8: noqa
 
+import importlib
 from importlib.metadata import version as _get_version
+from typing import TYPE_CHECKING
 
-from filefisher import _filefinder, _utils, cmip, filters
-from filefisher._filefinder import FileContainer, FileFinder
+if TYPE_CHECKING:
+    from filefisher import _filefinder, _utils, cmip, filters
+    from filefisher._filefinder import FileContainer, FileFinder
 
 __all__ = [
     "_filefinder",
@@ -14,6 +17,30 @@ __all__ = [
     "filters",
 ]
 
+# submodules and objects are imported on first access - importing pandas is slow
+_LAZY_SUBMODULES = {"_filefinder", "_utils", "cmip", "filters"}
+_LAZY_OBJECTS = {"FileContainer": "_filefinder", "FileFinder": "_filefinder"}
+
+
+def __getattr__(name):
+
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    if name in _LAZY_OBJECTS:
+        module = importlib.import_module(f"{__name__}.{_LAZY_OBJECTS[name]}")
+        obj = getattr(module, name)
+        globals()[name] = obj
+        return obj
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__():
+    # list the lazily imported names before they are accessed
+    return sorted(set(globals()) | _LAZY_SUBMODULES | set(_LAZY_OBJECTS))
+
+
 try:
     __version__ = _get_version("filefisher")
     del _get_version
@@ -1,8 +1,13 @@
+import concurrent.futures
 import fnmatch
+import functools
 import glob
+import heapq
 import logging
 import os
 import re
+import string
+import sys
 import warnings
 from typing import Any, Generator
 
@@ -12,6 +17,7 @@ import parse
 
 from filefisher._utils import (
     _find_keys,
+    _scandir_glob,
     natural_keys,
     product_dict,
     update_dict_with_kwargs,
@@ -19,6 +25,8 @@ from filefisher._utils import (
 
 logger = logging.getLogger(__name__)
 
+_SEPS = tuple(filter(None, (os.sep, os.altsep)))
+
 _FILE_FINDER_REPR = """<FileFinder>
 path_pattern: '{path_pattern}'
 file_pattern: '{file_pattern}'
@@ -27,6 +35,75 @@ keys: {repr_keys}
 """
 
 
+# replace the fmt spec - add the capture group again
+_FMT_SPEC_RE = re.compile(r"\{([A-Za-z0-9_]+)(:.*?)\}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern):
+    """find the keys, compile the parser and strip the fmt spec of a pattern
+
+    Cached, as FileFinder creates three finders and many FileFinder objects often share
+    the same patterns.
+    """
+
+    keys = _find_keys(pattern)
+    parser = parse.compile(pattern)
+    pattern_no_fmt_spec = _FMT_SPEC_RE.sub(r"{\1}", pattern)
+
+    # pre-parse the format string, so it is not parsed on every call of create_name
+    format_tokens = tuple(
+        (literal, field)
+        for literal, field, _, _ in string.Formatter().parse(pattern_no_fmt_spec)
+    )
+
+    return keys, parser, pattern_no_fmt_spec, format_tokens
+
+
+# private attributes of parse.Parser used to parse paths without a Result object
+_PARSER_ATTRS = ("_match_re", "_type_conversions", "_named_fields")
+
+
+def _merge_patterns(patterns):
+    """merge patterns which only differ in their last segment
+
+    Several patterns that only differ in their last segment (e.g., ``"/root/a_*"`` and
+    ``"/root/b_*"``) each list the same directory. They can be replaced by one pattern
+    (``"/root/*"``) - the paths found for each pattern are then obtained with
+    ``fnmatch``. Returns None if the patterns cannot be merged.
+
+    Notes
+    -----
+    Patterns with a literal last segment are not merged, as checking if they exist is
+    cheaper than listing the directory.
+    """
+
+    parts = set()
+    for pattern in patterns:
+
+        stripped = pattern.rstrip(os.sep)
+        head, sep, tail = stripped.rpartition(os.sep)
+        trailing = pattern[len(stripped) :]
+
+        # NOTE: "*" does not match hidden files
+        if (
+            not sep
+            or not glob.has_magic(tail)
+            or tail.startswith(".")
+            or (os.altsep and os.altsep in tail)
+        ):
+            return None
+
+        parts.add((head, trailing))
+
+    if len(parts) != 1:
+        return None
+
+    ((head, trailing),) = parts
+
+    return head + os.sep + "*" + trailing
+
+
 def _deprecate_allow_empty(**kwargs):
 
     _allow_empty = kwargs.get("_allow_empty")
@@ -35,7 +112,17 @@ def _deprecate_allow_empty(**kwargs):
         raise TypeError("`_allow_empty` has been deprecated in favour of `on_empty`")
 
 
-_RESERVED_PLACEHOLDERS = {"keys", "on_parse_error", "on_empty", "_allow_empty"}
+_RESERVED_PLACEHOLDERS = {
+    "keys",
+    "on_parse_error",
+    "on_empty",
+    "max_workers",
+    "_allow_empty",
+}
+
+# integer codes for on_parse_error, to avoid string comparisons per path
+_RAISE, _WARN, _IGNORE = 0, 1, 2
+_ON_PARSE_ERROR = {"raise": _RAISE, "warn": _WARN, "ignore": _IGNORE}
 
 
 def _assert_valid_keys(keys) -> None:
@@ -57,12 +144,28 @@ def _assert_unique(df) -> None:
 
 
 class _FinderBase:
+
+    # FileFinder creates three finders - avoid an instance dict for each of them
+    __slots__ = (
+        "pattern",
+        "keys",
+        "parser",
+        "_suffix",
+        "_wildcard_dict",
+        "_pattern_no_fmt_spec",
+        "_format_tokens",
+    )
+
     def __init__(self, pattern, suffix=""):
 
-        self.pattern = pattern
-        self.keys = _find_keys(pattern)
+        # sys.intern does not accept subclasses of str (e.g. np.str_)
+        pattern = str(pattern)
+        self.pattern = sys.intern(pattern)
+        keys, parser, pattern_no_fmt_spec, format_tokens = _compile_pattern(pattern)
+
+        self.keys = keys
         _assert_valid_keys(self.keys)
-        self.parser = parse.compile(self.pattern)
+        self.parser = parser
 
         if self.parser.fixed_fields:
             msg = (
@@ -72,11 +175,10 @@ class _FinderBase:
             raise ValueError(msg)
 
         self._suffix = suffix
+        self._wildcard_dict = dict.fromkeys(self.keys, "*")
 
-        # replace the fmt spec - add the capture group again
-        self._pattern_no_fmt_spec = re.sub(
-            r"\{([A-Za-z0-9_]+)(:.*?)\}", r"{\1}", pattern
-        )
+        self._pattern_no_fmt_spec = pattern_no_fmt_spec
+        self._format_tokens = format_tokens
 
     def create_name(self, keys=None, **keys_kwargs) -> str:
         """build name from keys
@@ -92,20 +194,45 @@ class _FinderBase:
 
         keys = update_dict_with_kwargs(keys, **keys_kwargs)
 
-        return self._pattern_no_fmt_spec.format(**keys)
+        return "".join(
+            [
+                literal if field is None else literal + format(keys[field])
+                for literal, field in self._format_tokens
+            ]
+        )
 
 
 class _Finder(_FinderBase):
+
+    __slots__ = ("_glob", "_fast_parse")
+
+    def __init__(self, pattern, suffix=""):
+
+        super().__init__(pattern, suffix=suffix)
+
+        # glob is an attribute so it can be replaced for the tests (see test_paths)
+        self._glob = _scandir_glob
+
+        # the fast path relies on private attributes of parse.Parser
+        self._fast_parse = all(hasattr(self.parser, attr) for attr in _PARSER_ATTRS)
+
     def _create_condition_dict(self, **kwargs):
 
-        # add wildcard for all undefinded keys
-        cond_dict = dict.fromkeys(self.keys, "*")
-        cond_dict.update(**kwargs)
+        # all keys are defined - no need to add wildcards
+        if kwargs.keys() >= self._wildcard_dict.keys():
+            return kwargs
 
-        return cond_dict
+        # add wildcard for all undefinded keys
+        return self._wildcard_dict | kwargs
 
     def find(
-        self, keys=None, *, on_parse_error="raise", on_empty="raise", **keys_kwargs
+        self,
+        keys=None,
+        *,
+        on_parse_error="raise",
+        on_empty="raise",
+        max_workers=1,
+        **keys_kwargs,
     ) -> "FileContainer":
         """find files in the file system using the file and path (folder) pattern
 
@@ -121,6 +248,10 @@ class _Finder(_FinderBase):
             Behaviour when no files are found: "raise" (default) raises a ValueError,
             "warn" raises a warning. For "warn" and "allow" an empty FileContainer is returned.
             an empty list.
+        max_workers : int, default: 1
+            Number of threads used to search the file system for several patterns.
+            Searching concurrently can be faster on file systems with a high latency
+            (e.g., network file systems).
         **keys_kwargs : {key: indexer, ...}, optional
             The keyword arguments form of ``keys``. When the same key is passed in
             ``keys`` and ``keys_kwargs`` the latter takes priority.
@@ -135,7 +266,8 @@ class _Finder(_FinderBase):
 
         keys = update_dict_with_kwargs(keys, **keys_kwargs)
 
-        if on_parse_error not in ("raise", "warn", "ignore"):
+        parse_error_mode = _ON_PARSE_ERROR.get(on_parse_error)
+        if parse_error_mode is None:
             raise ValueError(
                 f"Unknown value for 'on_parse_error': '{on_parse_error}'. Must be one of 'raise', 'warn' or 'ignore'."
             )
@@ -145,25 +277,62 @@ class _Finder(_FinderBase):
                 f"Unknown value for 'on_empty': '{on_empty}'. Must be one of 'raise', 'warn' or 'allow'."
             )
 
+        if (
+            not isinstance(max_workers, (int, np.integer))
+            or isinstance(max_workers, bool)
+            or max_workers < 1
+        ):
+            raise ValueError(
+                f"Invalid value for 'max_workers': {max_workers!r}. Must be a positive integer."
+            )
+
         # wrap strings and scalars in list
         for key, value in keys.items():
             if isinstance(value, str) or np.ndim(value) == 0:
                 keys[key] = [value]
 
-        all_paths = list()
+        # no need to create the product if at most one key has several values
+        several = [key for key, value in keys.items() if len(value) != 1]
+        if len(several) > 1:
+            search_dicts = product_dict(**keys)
+        else:
+            search_dict = {
+                key: next(iter(value))
+                for key, value in keys.items()
+                if key not in several
+            }
+            if several:
+                (key,) = several
+                search_dicts = [search_dict | {key: value} for value in keys[key]]
+            else:
+                search_dicts = [search_dict]
+
         all_patterns = list()
-        for one_search_dict in product_dict(**keys):
+        for one_search_dict in search_dicts:
 
             cond_dict = self._create_condition_dict(**one_search_dict)
             full_pattern = self.create_name(**cond_dict)
 
-            paths = sorted(self._glob(full_pattern), key=natural_keys)
+            all_patterns.append(full_pattern)
+
+        # patterns may overlap (e.g. "a*" and "*b") - only keep the first occurrence
+        # of a path, but duplicates of one pattern must still raise an error
+        sorted_paths, seen = list(), set()
+        for paths in self._glob_patterns(all_patterns, max_workers):
+            if seen:
+                paths = [path for path in paths if path not in seen]
+            seen.update(paths)
 
-            all_paths += paths
+            # sort the paths of each pattern and merge them into one sorted list
+            sorted_paths.append(sorted(paths, key=natural_keys))
 
-            all_patterns.append(full_pattern)
+        # merge lazily - the paths are only consumed by _parse_paths
+        if len(sorted_paths) == 1:
+            all_paths = sorted_paths[0]
+        else:
+            all_paths = heapq.merge(*sorted_paths, key=natural_keys)
 
-        if len(all_paths) == 0:
+        if not any(sorted_paths):
             msg = "Found no files matching criteria. Tried the following pattern(s):"
             msg += "".join(f"\n- '{pattern}'" for pattern in all_patterns)
 
@@ -174,7 +343,7 @@ class _Finder(_FinderBase):
                 warnings.warn(msg)
 
         # NOTE: also creates the correct (empty) df if no paths are found
-        df = self._parse_paths(all_paths, on_parse_error=on_parse_error)
+        df = self._parse_paths(all_paths, parse_error_mode)
         _assert_unique(df)
 
         return FileContainer(df)
@@ -212,45 +381,81 @@ class _Finder(_FinderBase):
 
         return fc
 
-    @staticmethod
-    def _glob(pattern) -> list[str]:
-        """Return a list of paths matching a pathname pattern
+    def _glob_patterns(self, patterns, max_workers=1) -> list[list[str]]:
+        """glob several patterns - optionally concurrently as globbing is I/O bound"""
 
-        Notes
-        -----
-        glob has it's own method so it can be mocked by the tests
+        if len(patterns) <= 1:
+            return [self._glob(pattern) for pattern in patterns]
 
-        """
+        # list the shared parent directory only once
+        merged_pattern = _merge_patterns(patterns)
+        if merged_pattern is not None:
+            candidates = self._glob(merged_pattern)
+            return [fnmatch.filter(candidates, pattern) for pattern in patterns]
+
+        if max_workers == 1:
+            return [self._glob(pattern) for pattern in patterns]
 
-        return glob.glob(pattern)
+        max_workers = min(max_workers, len(patterns))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map preserves the order of the patterns
+            return list(executor.map(self._glob, patterns))
 
-    def _parse_paths(self, paths, on_parse_error) -> pd.DataFrame:
+    def _parse_paths(self, paths, parse_error_mode) -> pd.DataFrame:
+        """parse an iterable of paths into a DataFrame"""
 
-        valid_paths, out = list(), list()
+        suffix = self._suffix
+
+        # collect the values column-wise
+        valid_paths, columns = list(), [list() for _ in self.keys]
         for path in paths:
-            parsed = self.parser.parse(path)
+            parsed = self._parse_path(path)
 
             if parsed is None:
-                if on_parse_error == "raise":
-                    raise ValueError(
-                        f"Could not parse '{path}' with the pattern '{self.pattern}' - are"
-                        " there contradictory values?"
-                    )
-                elif on_parse_error == "warn":
-                    warnings.warn(
-                        f"Could not parse '{path}' with the pattern '{self.pattern}' - are"
-                        " there contradictory values?"
-                    )
-                elif on_parse_error == "ignore":
-                    pass
+                if parse_error_mode == _IGNORE:
+                    continue
+
+                msg = (
+                    f"Could not parse '{path}' with the pattern '{self.pattern}' - are"
+                    " there contradictory values?"
+                )
+                if parse_error_mode == _RAISE:
+                    raise ValueError(msg)
+                warnings.warn(msg)
             else:
-                valid_paths.append(path)
-                out.append(list(parsed.named.values()))
-
-        index = pd.Index(valid_paths, name="path") + self._suffix
-        df = pd.DataFrame(out, columns=self.keys, index=index)
+                valid_paths.append(path + suffix)
+                for column, value in zip(columns, parsed):
+                    column.append(value)
+
+        index = pd.Index(valid_paths, name="path")
+
+        # empty lists would be cast to float
+        dtype = None if valid_paths else object
+        data = dict(zip(self.keys, columns))
+        # pass the columns explicitly - else there is a RangeIndex if there are no keys
+        df = pd.DataFrame(
+            data, index=index, columns=list(self.keys), dtype=dtype, copy=False
+        )
         return df
 
+    def _parse_path(self, path) -> list | None:
+        """parse the values of the keys from a path, returns None if unparsable"""
+
+        if not self._fast_parse:
+            result = self.parser.parse(path)
+            return None if result is None else list(result.named.values())
+
+        match = self.parser._match_re.match(path)
+
+        if match is None:
+            return None
+
+        # use the regex directly, unless parse needs to convert the types
+        if self.parser._type_conversions:
+            return list(self.parser.evaluate_result(match).named.values())
+
+        return [match[group] for group in self.parser._named_fields]
+
 
 class FileFinder:
 
@@ -284,11 +489,20 @@ class FileFinder:
                 f"`file_pattern` cannot contain path separator ('{os.path.sep}')"
             )
 
+        path_pattern = os.fspath(path_pattern)
+
+        # ensure path_pattern ends with a / (like os.path.join(path_pattern, ""))
+        if path_pattern and not path_pattern.endswith(_SEPS):
+            path_pattern_sep = path_pattern + os.sep
+        else:
+            path_pattern_sep = path_pattern
+
+        full_pattern = path_pattern_sep + file_pattern if file_pattern else path_pattern
+
         # cannot search for files (only paths and full)
         self.file = _FinderBase(file_pattern)
-        # ensure path_pattern ends with a /
-        self.path = _Finder(os.path.join(path_pattern, ""), suffix="*")
-        self.full = _Finder(os.path.join(*filter(None, (path_pattern, file_pattern))))
+        self.path = _Finder(path_pattern_sep, suffix="*")
+        self.full = _Finder(full_pattern)
 
         self.keys_path = self.path.keys
         self.keys_file = self.file.keys
@@ -414,7 +628,13 @@ class FileFinder:
         return self.full.create_name(keys, **keys_kwargs)
 
     def find_paths(
-        self, keys=None, *, on_parse_error="raise", on_empty="raise", **keys_kwargs
+        self,
+        keys=None,
+        *,
+        on_parse_error="raise",
+        on_empty="raise",
+        max_workers=1,
+        **keys_kwargs,
     ) -> "FileContainer":
         """find files in the file system using the file and path (folder) pattern
 
@@ -429,6 +649,10 @@ class FileFinder:
         on_empty : "raise" | "warn" | "allow", default: "raise"
             Behaviour when no files are found: "raise" (default) raises a ValueError,
             "warn" raises a warning. For "warn" and "allow" an empty FileContainer is returned.
+        max_workers : int, default: 1
+            Number of threads used to search the file system for several patterns.
+            Searching concurrently can be faster on file systems with a high latency
+            (e.g., network file systems).
         **keys_kwargs : {key: indexer, ...}, optional
             The keyword arguments form of ``keys``. When the same key is passed in
             ``keys`` and ``keys_kwargs`` the latter takes priority.
@@ -460,11 +684,18 @@ class FileFinder:
             keys,
             on_parse_error=on_parse_error,
             on_empty=on_empty,
+            max_workers=max_workers,
             **keys_kwargs,
         )
 
     def find_files(
-        self, keys=None, *, on_parse_error="raise", on_empty="raise", **keys_kwargs
+        self,
+        keys=None,
+        *,
+        on_parse_error="raise",
+        on_empty="raise",
+        max_workers=1,
+        **keys_kwargs,
     ) -> "FileContainer":
         """find files in the file system using the file pattern
 
@@ -479,6 +710,10 @@ class FileFinder:
         on_empty : "raise" | "warn" | "allow", default: "raise"
             Behaviour when no files are found: "raise" (default) raises a ValueError,
             "warn" raises a warning. For "warn" and "allow" an empty FileContainer is returned.
+        max_workers : int, default: 1
+            Number of threads used to search the file system for several patterns.
+            Searching concurrently can be faster on file systems with a high latency
+            (e.g., network file systems).
         **keys_kwargs : {key: indexer, ...}, optional
             The keyword arguments form of ``keys``. When the same key is passed in
             ``keys`` and ``keys_kwargs`` the latter takes priority.
@@ -513,6 +748,7 @@ class FileFinder:
             keys,
             on_parse_error=on_parse_error,
             on_empty=on_empty,
+            max_workers=max_workers,
             **keys_kwargs,
         )
 
@@ -598,8 +834,7 @@ class FileContainer:
             stacklevel=2,
         )
 
-        for index, element in self.df.iterrows():
-            yield index, element.to_dict()
+        yield from self._iter_items()
 
     def __getitem__(self, key):
 
@@ -622,8 +857,22 @@ class FileContainer:
         return self.df.index.to_list()
 
     def items(self) -> Generator[tuple[str, dict[str, Any]], None, None]:
-        for index, element in self.df.iterrows():
-            yield index, element.to_dict()
+        yield from self._iter_items()
+
+    def _iter_items(self):
+        # avoid iterrows which creates a pd.Series for every row
+        columns = self.df.columns.to_list()
+
+        # itertuples does not yield any rows if there are no columns
+        if not columns:
+            for index in self.df.index:
+                yield index, {}
+            return
+
+        rows = self.df.itertuples(index=False, name=None)
+
+        for index, row in zip(self.df.index, rows):
+            yield index, dict(zip(columns, row))
 
     def combine_by_key(self, keys=None, sep="."):
         warnings.warn(
@@ -639,7 +888,16 @@ class FileContainer:
         if keys is None:
             keys = list(self.df.columns)
 
-        return self.df[list(keys)].apply(lambda x: sep.join(x.map(str)), axis=1)
+        # join column-wise to avoid a row-wise apply - map(str) converts NaN to "nan"
+        columns = [self.df[key].map(str).to_list() for key in keys]
+
+        if columns:
+            combined = [sep.join(row) for row in zip(*columns)]
+        else:
+            # zip() would not yield any rows
+            combined = [""] * len(self.df)
+
+        return pd.Series(combined, index=self.df.index)
 
     def search(self, **query):
         """subset paths given a search query
@@ -702,12 +960,14 @@ class FileContainer:
                 [], columns=self.df.columns, index=pd.Index([], name="path")
             )
 
-        sel = True
+        masks = list()
         for key, value in query.items():
             # isin does not handle scalars
             value = [value] if np.ndim(value) == 0 else value
 
-            sel &= self.df[key].isin(value)
+            masks.append(self.df[key].isin(value).to_numpy())
+
+        sel = np.logical_and.reduce(masks)
 
         return self.df[sel]
 
@@ -1,7 +1,18 @@
+import fnmatch
+import functools
+import glob
 import itertools
+import os
 import re
+import sys
 
-import pandas as pd
+# match group
+_KEY_RE = re.compile(
+    r"\{"
+    r"([A-Za-z0-9_]+)"  # capturing group with one or more characters, number or _
+    r"(?::.*?)?"  # non-capturing group, non greedy matching any char, zero or once
+    r"\}"
+)
 
 
 def _find_keys(string):
@@ -16,20 +27,16 @@ def _find_keys(string):
     True
     """
 
-    # match group
-    pattern = (
-        r"\{"
-        r"([A-Za-z0-9_]+)"  # capturing group with one or more characters, number or _
-        r"(?::.*?)?"  # non-capturing group, non greedy matching any char, zero or once
-        r"\}"
-    )
-
-    keys = re.findall(pattern, string)
-    keys = tuple(pd.Series(keys).unique())
+    keys = _KEY_RE.findall(string)
+    # interned keys compare by identity with the (interned) keyword arguments
+    keys = tuple(sys.intern(key) for key in dict.fromkeys(keys))
 
     return keys
 
 
+_NATURAL_KEYS_RE = re.compile(r"(\d+)")
+
+
 def atoi(text):
     return int(text) if text.isdigit() else text
 
@@ -48,7 +55,7 @@ def natural_keys(text):
     ----------
     http://nedbatchelder.com/blog/200712/human_sorting.html
     """
-    return [atoi(c) for c in re.split(r"(\d+)", text)]
+    return [int(c) if c.isdigit() else c for c in _NATURAL_KEYS_RE.split(text)]
 
 
 def product_dict(**kwargs):
@@ -64,7 +71,7 @@ def product_dict(**kwargs):
     https://stackoverflow.com/a/5228294/3010700
     """
 
-    keys = kwargs.keys()
+    keys = tuple(kwargs)
     for instance in itertools.product(*kwargs.values()):
         yield dict(zip(keys, instance))
 
@@ -79,6 +86,11 @@ def update_dict_with_kwargs(dictionary, /, **kwargs):
     **kwargs : keyword arguments
         The keyword arguments.
 
+    Returns
+    -------
+    updated : dict
+        A new dictionary, ``dictionary`` is never modified.
+
     Examples
     --------
     >>> update_dict_with_kwargs({"a": 1}, a=2)
@@ -87,9 +99,112 @@ def update_dict_with_kwargs(dictionary, /, **kwargs):
     {'a': 1, 'b': 3, 'c': 5}
     """
 
-    if not isinstance(dictionary, (dict, type(None))):
+    # kwargs is a new dict on every call - no need to copy it
+    if dictionary is None:
+        return kwargs
+
+    if not isinstance(dictionary, dict):
         raise TypeError(
             f"First argument must be a dict or None, got '{type(dictionary).__name__}'"
         )
 
-    return (dictionary or {}) | kwargs
+    return dictionary | kwargs
+
+
+def _scandir_glob(pattern):
+    """Return a list of paths matching a pathname pattern
+
+    Like ``glob.glob`` (non-recursive) but the directory tree is walked with
+    ``os.scandir`` - the entries are matched on their name and ``DirEntry.is_dir`` is
+    used to find subdirectories which avoids a ``stat`` call per entry on most file
+    systems. Literal path segments are joined without listing the directory.
+    """
+
+    if not pattern:
+        return []
+
+    # let glob handle alternative separators (i.e. "/" on windows)
+    if os.altsep and os.altsep in pattern:
+        return glob.glob(pattern)
+
+    segments = _normalize_segments(pattern.split(os.sep))
+
+    return list(_iglob("", segments, is_dir=False))
+
+
+def _normalize_segments(segments):
+    """drop empty segments (i.e., repeated separators) the way glob does
+
+    glob keeps the literal part of a pattern unchanged but joins the paths it finds
+    with a single separator, e.g. ``"*//foo"`` returns ``"a/foo"``.
+    """
+
+    magic = [glob.has_magic(segment) for segment in segments]
+
+    # literal patterns are returned unchanged
+    if not any(magic):
+        return segments
+
+    first_magic = magic.index(True)
+    literal, rest = segments[:first_magic], segments[first_magic:]
+
+    # strip trailing separators of the literal part - unless it is the root
+    if any(literal):
+        while not literal[-1]:
+            literal.pop()
+
+    # keep a trailing empty segment - the pattern ends with a separator
+    rest = [segment for segment in rest[:-1] if segment] + rest[-1:]
+
+    return literal + rest
+
+
+def _iglob(head, segments, is_dir):
+
+    segment, *segments = segments
+
+    # last segment
+    if not segments:
+        # the pattern ends with a separator - only directories match
+        if not segment:
+            if is_dir or os.path.isdir(head):
+                yield head
+        elif not glob.has_magic(segment):
+            if os.path.lexists(head + segment):
+                yield head + segment
+        else:
+            for entry in _scandir_filter(head, segment):
+                yield head + entry.name
+        return
+
+    if not glob.has_magic(segment):
+        yield from _iglob(head + segment + os.sep, segments, is_dir=False)
+        return
+
+    for entry in _scandir_filter(head, segment):
+        if entry.is_dir():
+            yield from _iglob(head + entry.name + os.sep, segments, is_dir=True)
+
+
+def _scandir_filter(dirname, segment):
+
+    match = _compile_segment(segment)
+
+    # like glob: "*" does not match hidden files
+    include_hidden = segment.startswith(".")
+
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            return [
+                entry
+                for entry in it
+                if (include_hidden or not entry.name.startswith("."))
+                and match(os.path.normcase(entry.name))
+            ]
+    except OSError:
+        return []
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_segment(segment):
+    return re.compile(fnmatch.translate(os.path.normcase(segment))).match
@@ -1,5 +1,4 @@
-import pandas as pd
-import parse
+import re
 
 from filefisher.filters import priority_filter
 
@@ -7,25 +6,19 @@ from filefisher.filters import priority_filter
 VALID_GRIDS = ("gn", "gr", "gr1", "gm")
 
 
-def parse_ens(filelist):
+# cmip6 ensemble members have a forcing index ("r1i1p1f1"), cmip5 members do not
+_ENS_RE = re.compile(r"^r(?P<r>\d+)i(?P<i>\d+)p(?P<p>\d+)(?:f(?P<f>\d+))?$")
 
-    ens = filelist.df["ens"]
 
-    # for cmip6
-    if "f" in ens.iloc[0]:
-        parser = parse.compile("r{r}i{i}p{p}f{f}")
-    # for cmip5
-    else:
-        parser = parse.compile("r{r}i{i}p{p}")
+def parse_ens(filelist):
 
-    out = list()
-    for i, one_ens in zip(ens.index, ens):
-        parsed = parser.parse(one_ens)
-        out.append(list(parsed.named.values()))
+    ens = filelist.df["ens"]
 
-    keys = list(parsed.named.keys())
+    df = ens.str.extract(_ENS_RE, expand=True)
 
-    df = pd.DataFrame(out, columns=keys)
+    # for cmip5
+    if df["f"].isna().all():
+        df = df.drop(columns="f")
 
     for key in df.columns:
         filelist.df[key] = df[key].values
@@ -40,15 +33,9 @@ def create_ensnumber(filelist, keys=None):
 
     keys = list(keys)
     df = filelist.df
-    multiindex = pd.MultiIndex.from_frame(df[keys])
-
-    df["ensnumber"] = -1
-
-    for idx in multiindex.unique():
 
-        sel = multiindex == idx
-        numbers = list(range(sel.sum()))
-        df.loc[sel, "ensnumber"] = numbers
+    # number the members of each group in order of appearance
+    df["ensnumber"] = df.groupby(keys, sort=False, dropna=False).cumcount()
 
     filelist.df = df
     return filelist
@@ -1,7 +1,7 @@
 import functools
 import warnings
 
-import pandas as pd
+import numpy as np
 
 
 def _wrap_filecontainer(func):
@@ -69,62 +69,64 @@ def priority_filter(obj, column, order, *, on_missing="raise", groupby=None):
 
     groupby = list(groupby)
 
-    # create a MultiIndex -> can directly index over multiple keys
-    mi = pd.MultiIndex.from_frame(obj[groupby])
-
     # there are models with more than one grid
-    if mi.has_duplicates:
+    if obj.duplicated(subset=groupby).any():
 
-        obj = _prioritize(obj, column, order, on_missing, mi)
+        obj = _prioritize(obj, column, order, on_missing, groupby)
 
         # double check
-        mi = pd.MultiIndex.from_frame(obj[groupby])
-
-        if mi.has_duplicates:
+        if obj.duplicated(subset=groupby).any():
             raise ValueError("Something went wrong")
 
     return obj
 
 
-def _prioritize(df, key, order, on_missing, multiindex):
+def _prioritize(df, key, order, on_missing, groupby):
 
-    out = list()
+    # group number of each row - in order of appearance
+    grouped = df.groupby(groupby, sort=False, dropna=False)
+    codes = grouped.ngroup().to_numpy()
+    n_groups = grouped.ngroups
 
-    # loop entries
-    for idx in multiindex.unique():
+    # rank of each row in the priority list - the first occurrence in order wins
+    ranks = dict()
+    for rank, element in enumerate(order):
+        ranks.setdefault(element, rank)
 
-        one_ = df.iloc[multiindex.get_locs(idx)]
+    not_found = len(order)
+    rank = df[key].map(ranks).fillna(not_found).to_numpy(dtype=int)
 
-        # select the first that is found
-        for element in order:
-            if element in one_[key].values:
+    # select the rows with the highest priority per group
+    min_rank = np.full(n_groups, not_found)
+    np.minimum.at(min_rank, codes, rank)
 
-                selected = one_[one_[key] == element]
+    selected = (rank == min_rank[codes]) & (rank != not_found)
+    n_selected = np.bincount(codes[selected], minlength=n_groups)
 
-                if len(selected) != 1:
-                    idx_string = one_.to_string()
-                    raise ValueError(
-                        f"Found more than one `df[{key}] == '{element}'` for\n{idx_string}"
-                    )
+    # handle groups with more than one or no selected element - in order
+    for group in np.flatnonzero(n_selected != 1):
 
-                out.append(selected)
-                break
+        idx_string = df.iloc[codes == group].to_string()
 
-        # no entry was found
-        else:
-            idx_string = one_.to_string()
+        if n_selected[group] > 1:
+            element = order[min_rank[group]]
+            raise ValueError(
+                f"Found more than one `df[{key}] == '{element}'` for\n{idx_string}"
+            )
 
-            if on_missing == "raise":
-                raise ValueError(
-                    f"Did not find any element from the priority list for\n{idx_string}"
-                )
-            elif on_missing == "warn":
-                warnings.warn(
-                    f"Did not find any element from the priority list for\n{idx_string}"
-                )
-            elif on_missing == "ignore":
-                pass
+        if on_missing == "raise":
+            raise ValueError(
+                f"Did not find any element from the priority list for\n{idx_string}"
+            )
+        elif on_missing == "warn":
+            warnings.warn(
+                f"Did not find any element from the priority list for\n{idx_string}"
+            )
+        elif on_missing == "ignore":
+            pass
 
-    df = pd.concat(out, axis=0)
+    # one row per group, ordered by group
+    positions = np.flatnonzero(selected)
+    positions = positions[np.argsort(codes[positions], kind="stable")]
 
-    return df
+    return df.iloc[positions]
@@ -15,6 +15,20 @@ def assert_no_warnings():
         assert len(record) == 0, "got unexpected warning(s)"
 
 
+def create_df(paths: list[str], **columns: list) -> pd.DataFrame:
+    """create a DataFrame with a "path" index, as found by a `FileFinder`
+
+    Parameters
+    ----------
+    paths : list of str
+        The paths, used as index.
+    **columns : list
+        The values of each key.
+    """
+
+    return pd.DataFrame(columns, index=pd.Index(paths, name="path"))
+
+
 def assert_filecontainer_empty(
     fc: FileContainer, columns: str | Iterable[str] | None = None
 ):
@@ -79,6 +79,22 @@ def test_fc_items(example_df, example_fc):
     assert result == expected
 
 
+def test_fc_items_no_keys():
+
+    # e.g. from a pattern without placeholders
+    df = pd.DataFrame(index=pd.Index(["file0", "file1"], name="path"))
+    fc = FileContainer(df)
+
+    expected = [("file0", {}), ("file1", {})]
+
+    assert list(fc.items()) == expected
+
+    with pytest.warns(
+        FutureWarning, match="iterating over a `FileContainer` is deprecated"
+    ):
+        assert list(fc) == expected
+
+
 def test_fc_getitem(example_df, example_fc):
 
     # indexing by scalar currently returns path, meta (analog to the loop)
@@ -198,16 +214,45 @@ def test_fc_combine_by_keys(example_fc):
     result = example_fc._combine_by_keys()
     expected = map(".".join, example_fc.df.values)
     expected = pd.Series(expected, index=example_fc.df.index)
+    pd.testing.assert_series_equal(result, expected)
 
     # different sep
     result = example_fc._combine_by_keys(sep="|")
     expected = map("|".join, example_fc.df.values)
     expected = pd.Series(expected, index=example_fc.df.index)
+    pd.testing.assert_series_equal(result, expected)
 
     # not all columns
     result = example_fc._combine_by_keys(keys=("model", "res"))
     expected = map(".".join, example_fc.df[["model", "res"]].values)
     expected = pd.Series(expected, index=example_fc.df.index)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_fc_combine_by_keys_no_keys(example_fc):
+
+    expected = pd.Series(["", "", "", "", ""], index=example_fc.df.index)
+
+    result = example_fc._combine_by_keys(keys=[])
+    pd.testing.assert_series_equal(result, expected)
+
+    # container without columns
+    fc = FileContainer(example_fc.df[[]])
+    result = fc._combine_by_keys()
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_fc_combine_by_keys_nan():
+
+    df = pd.DataFrame(
+        {"model": ["a", None], "num": [1.0, float("nan")]},
+        index=pd.Index(["file0", "file1"], name="path"),
+    )
+    fc = FileContainer(df)
+
+    result = fc._combine_by_keys()
+    expected = pd.Series(["a.1.0", "nan.nan"], index=df.index)
+    pd.testing.assert_series_equal(result, expected)
 
 
 def test_filefinder_repr(example_fc):
@@ -1,13 +1,13 @@
 import os
-import textwrap
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from filefisher import FileFinder
-from filefisher._filefinder import _assert_unique
+from filefisher._filefinder import _assert_unique, _merge_patterns
 
-from . import assert_filecontainer_empty
+from . import assert_filecontainer_empty, create_df
 
 
 @pytest.fixture(scope="module")
@@ -48,24 +48,64 @@ def test_paths(request, tmp_path):
     return paths
 
 
-@pytest.mark.parametrize("placeholder", ("keys", "on_parse_error", "_allow_empty"))
-def test_pattern_invalid_placeholder(placeholder):
+@pytest.fixture(scope="module")
+def ff_paths(tmp_path, test_paths):
+    return FileFinder(tmp_path / "{a}/{b}", "file_pattern", test_paths=test_paths)
 
-    with pytest.raises(ValueError, match=f"'{placeholder}' is not a valid placeholder"):
-        FileFinder("", f"{{{placeholder}}}")
+
+@pytest.fixture(scope="module")
+def ff_files(tmp_path, test_paths):
+    return FileFinder(tmp_path / "{a}/foo", "{b}", test_paths=test_paths)
+
+
+@pytest.mark.parametrize("slot", ("path_pattern", "file_pattern"))
+@pytest.mark.parametrize(
+    "placeholder",
+    ("keys", "on_parse_error", "on_empty", "max_workers", "_allow_empty"),
+)
+def test_pattern_invalid_placeholder(placeholder, slot):
+
+    patterns = {"path_pattern": "", "file_pattern": ""}
+    patterns[slot] = f"{{{placeholder}}}"
 
     with pytest.raises(ValueError, match=f"'{placeholder}' is not a valid placeholder"):
-        FileFinder(f"{{{placeholder}}}", "")
+        FileFinder(**patterns)
 
 
+@pytest.mark.parametrize("slot", ("path_pattern", "file_pattern"))
 @pytest.mark.parametrize("pattern", ("{}", "{_fixed}"))
-def test_only_named_fields(pattern):
+def test_only_named_fields(pattern, slot):
 
-    with pytest.raises(ValueError, match="Only named fields are currently allowed"):
-        FileFinder("", pattern)
+    patterns = {"path_pattern": "", "file_pattern": ""}
+    patterns[slot] = pattern
 
     with pytest.raises(ValueError, match="Only named fields are currently allowed"):
-        FileFinder(pattern, "")
+        FileFinder(**patterns)
+
+
+@pytest.mark.parametrize(
+    "patterns, expected",
+    (
+        (["/root/a_*", "/root/b_*"], "/root/*"),
+        (["/root/*/a_*/", "/root/*/b_*/"], "/root/*/*/"),
+        (["/a_*", "/b_*"], "/*"),
+        # different parent directory
+        (["/root/a/*", "/root/b/*"], None),
+        # literal last segment
+        (["/root/a", "/root/b_*"], None),
+        # hidden files
+        (["/root/.a*", "/root/.b*"], None),
+        # no parent directory
+        (["a_*", "b_*"], None),
+    ),
+)
+def test_merge_patterns(patterns, expected):
+
+    patterns = [pattern.replace("/", os.path.sep) for pattern in patterns]
+    if expected is not None:
+        expected = expected.replace("/", os.path.sep)
+
+    assert _merge_patterns(patterns) == expected
 
 
 def test_assert_unique():
@@ -102,6 +142,37 @@ def test_wrong_on_empty():
         ff.find_files(on_empty="null")
 
 
+@pytest.mark.parametrize("max_workers", (0, -1, 2.5, None, "2", True))
+def test_wrong_max_workers(max_workers):
+
+    # several patterns which cannot be merged
+    ff = FileFinder("{a}/", "{b}", test_paths=["a1/b1", "a2/b2"])
+    msg = "Invalid value for 'max_workers'.*Must be a positive integer."
+    with pytest.raises(ValueError, match=msg):
+        ff.find_paths(a=["a1", "a2"], b=["b1", "b2"], max_workers=max_workers)
+
+    # one pattern
+    with pytest.raises(ValueError, match=msg):
+        ff.find_files(a="a1", max_workers=max_workers)
+
+
+def test_pattern_str_subclass():
+
+    # e.g. patterns read from a numpy array or a DataFrame
+    path_pattern = np.str_("/data/{a}/x")
+    file_pattern = np.str_("{c}_{d}.nc")
+
+    test_paths = ["/data/a1/x" + os.path.sep + "c1_d1.nc"]
+    ff = FileFinder(path_pattern, file_pattern, test_paths=test_paths)
+
+    assert ff.path_pattern == "/data/{a}/x" + os.path.sep
+    assert ff.file_pattern == "{c}_{d}.nc"
+
+    expected = create_df(test_paths, a=["a1"], c=["c1"], d=["d1"])
+    result = ff.find_files()
+    pd.testing.assert_frame_equal(result.df, expected)
+
+
 def test_pattern_property():
 
     path_pattern = "path_pattern/"
@@ -174,28 +245,26 @@ def test_repr():
     file_pattern = "{b}_{c}"
     ff = FileFinder(path_pattern=path_pattern, file_pattern=file_pattern)
 
-    expected = """\
-    <FileFinder>
-    path_pattern: '/{a}/{b}/'
-    file_pattern: '{b}_{c}'
-
-    keys: 'a', 'b', 'c'
-    """
-    expected = textwrap.dedent(expected)
+    expected = (
+        "<FileFinder>\n"
+        "path_pattern: '/{a}/{b}/'\n"
+        "file_pattern: '{b}_{c}'\n"
+        "\n"
+        "keys: 'a', 'b', 'c'\n"
+    )
     assert expected == ff.__repr__()
 
     path_pattern = "{a}"
     file_pattern = "file_pattern"
     ff = FileFinder(path_pattern=path_pattern, file_pattern=file_pattern)
 
-    expected = """\
-    <FileFinder>
-    path_pattern: '{a}/'
-    file_pattern: 'file_pattern'
-
-    keys: 'a'
-    """
-    expected = textwrap.dedent(expected)
+    expected = (
+        "<FileFinder>\n"
+        "path_pattern: '{a}/'\n"
+        "file_pattern: 'file_pattern'\n"
+        "\n"
+        "keys: 'a'\n"
+    )
     assert expected == ff.__repr__()
 
 
@@ -247,7 +316,11 @@ def test_create_name_kwargs_priority():
     assert result == "a/b/b_c"
 
 
-def test_find_path_none_found(tmp_path, test_paths):
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [((), {"a": "foo"}), (({"a": "foo"},), {}), (({"a": "a1"},), {"a": "foo"})],
+)
+def test_find_path_none_found(tmp_path, test_paths, args, kwargs):
 
     path_pattern = tmp_path / "{a}/foo/"
     file_pattern = "file_pattern"
@@ -257,23 +330,13 @@ def test_find_path_none_found(tmp_path, test_paths):
     )
 
     with pytest.raises(ValueError, match="Found no files matching criteria"):
-        ff.find_paths(a="foo")
-
-    with pytest.raises(ValueError, match="Found no files matching criteria"):
-        ff.find_paths({"a": "foo"})
+        ff.find_paths(*args, **kwargs)
 
     with pytest.warns(match="Found no files matching criteria"):
-        result = ff.find_paths(a="foo", on_empty="warn")
+        result = ff.find_paths(*args, on_empty="warn", **kwargs)
     assert_filecontainer_empty(result, columns="a")
 
-    with pytest.warns(match="Found no files matching criteria"):
-        result = ff.find_paths({"a": "foo"}, on_empty="warn")
-    assert_filecontainer_empty(result, columns="a")
-
-    result = ff.find_paths(a="foo", on_empty="allow")
-    assert_filecontainer_empty(result, columns="a")
-
-    result = ff.find_paths({"a": "foo"}, on_empty="allow")
+    result = ff.find_paths(*args, on_empty="allow", **kwargs)
     assert_filecontainer_empty(result, columns="a")
 
 
@@ -287,6 +350,21 @@ def test_find_paths_non_unique():
         ff.find_paths()
 
 
+@pytest.mark.parametrize("test_paths", (["/root/A1/x/c"], []), ids=("found", "empty"))
+def test_find_files_no_keys(test_paths):
+
+    # pattern without placeholders
+    ff = FileFinder("/root/A1/x", "c", test_paths=test_paths)
+
+    expected = pd.DataFrame(
+        index=pd.Index(test_paths, name="path"),
+        columns=pd.Index([], dtype=object),
+    )
+
+    result = ff.find_files(on_empty="allow")
+    pd.testing.assert_frame_equal(result.df, expected)
+
+
 def test_find_paths_simple(tmp_path, test_paths):
 
     path_pattern = tmp_path / "a1/{a}/"
@@ -296,8 +374,7 @@ def test_find_paths_simple(tmp_path, test_paths):
         path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
     )
 
-    expected = {"path": {0: str(tmp_path / "a1/foo/*")}, "a": {0: "foo"}}
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    expected = create_df([str(tmp_path / "a1/foo/*")], a=["foo"])
 
     result = ff.find_paths(a="foo")
     pd.testing.assert_frame_equal(result.df, expected)
@@ -310,29 +387,21 @@ def test_find_paths_simple(tmp_path, test_paths):
 
 
 @pytest.mark.parametrize("find_kwargs", [{"b": "foo"}, {"a": "*", "b": "foo"}])
-def test_find_paths_wildcard(tmp_path, test_paths, find_kwargs):
+def test_find_paths_wildcard(tmp_path, ff_paths, find_kwargs):
 
-    path_pattern = tmp_path / "{a}/{b}"
-    file_pattern = "file_pattern"
-
-    ff = FileFinder(
-        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    expected = create_df(
+        [str(tmp_path / "a1/foo/*"), str(tmp_path / "a2/foo/*")],
+        a=["a1", "a2"],
+        b=["foo", "foo"],
     )
 
-    expected = {
-        "path": {0: str(tmp_path / "a1/foo/*"), 1: str(tmp_path / "a2/foo/*")},
-        "a": {0: "a1", 1: "a2"},
-        "b": {0: "foo", 1: "foo"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
-
-    result = ff.find_paths(**find_kwargs)
+    result = ff_paths.find_paths(**find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_paths(find_kwargs)
+    result = ff_paths.find_paths(find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_paths({"b": "XXX"}, **find_kwargs)
+    result = ff_paths.find_paths({"b": "XXX"}, **find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
@@ -340,29 +409,21 @@ def test_find_paths_wildcard(tmp_path, test_paths, find_kwargs):
     "find_kwargs",
     [{"a": ["a1", "a2"], "b": "foo"}, {"a": ["a1", "a2"], "b": ["foo", "bar"]}],
 )
-def test_find_paths_several(tmp_path, test_paths, find_kwargs):
-
-    path_pattern = tmp_path / "{a}/{b}"
-    file_pattern = "file_pattern"
+def test_find_paths_several(tmp_path, ff_paths, find_kwargs):
 
-    ff = FileFinder(
-        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    expected = create_df(
+        [str(tmp_path / "a1/foo/*"), str(tmp_path / "a2/foo/*")],
+        a=["a1", "a2"],
+        b=["foo", "foo"],
     )
 
-    expected = {
-        "path": {0: str(tmp_path / "a1/foo/*"), 1: str(tmp_path / "a2/foo/*")},
-        "a": {0: "a1", 1: "a2"},
-        "b": {0: "foo", 1: "foo"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
-
-    result = ff.find_paths(**find_kwargs)
+    result = ff_paths.find_paths(**find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_paths(find_kwargs)
+    result = ff_paths.find_paths(find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_paths({"a": "XXX", "b": "XXX"}, **find_kwargs)
+    result = ff_paths.find_paths({"a": "XXX", "b": "XXX"}, **find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
@@ -370,29 +431,17 @@ def test_find_paths_several(tmp_path, test_paths, find_kwargs):
     "find_kwargs",
     [{"a": "a1"}, {"a": "a1", "b": "foo"}, {"a": "a1", "b": ["foo", "bar"]}],
 )
-def test_find_paths_one_of_several(tmp_path, test_paths, find_kwargs):
+def test_find_paths_one_of_several(tmp_path, ff_paths, find_kwargs):
 
-    path_pattern = tmp_path / "{a}/{b}"
-    file_pattern = "file_pattern"
+    expected = create_df([str(tmp_path / "a1/foo/*")], a=["a1"], b=["foo"])
 
-    ff = FileFinder(
-        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
-    )
-
-    expected = {
-        "path": {0: str(tmp_path / "a1/foo/*")},
-        "a": {0: "a1"},
-        "b": {0: "foo"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
-
-    result = ff.find_paths(**find_kwargs)
+    result = ff_paths.find_paths(**find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_paths(find_kwargs)
+    result = ff_paths.find_paths(find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_paths({"a": "XXX"}, **find_kwargs)
+    result = ff_paths.find_paths({"a": "XXX"}, **find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
@@ -413,8 +462,7 @@ def test_find_single_path(tmp_path, test_paths):
     with pytest.raises(ValueError, match="Found no files matching criteria"):
         ff.find_single_path(a="a3")
 
-    expected = {"path": {0: str(tmp_path / "a1/foo/*")}, "a": {0: "a1"}}
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    expected = create_df([str(tmp_path / "a1/foo/*")], a=["a1"])
 
     result = ff.find_single_path(a="a1")
     pd.testing.assert_frame_equal(result.df, expected)
@@ -423,7 +471,11 @@ def test_find_single_path(tmp_path, test_paths):
     pd.testing.assert_frame_equal(result.df, expected)
 
 
-def test_find_file_none_found(tmp_path, test_paths):
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [((), {"a": "XXX"}), (({"a": "XXX"},), {}), (({"a": "a1"},), {"a": "XXX"})],
+)
+def test_find_file_none_found(tmp_path, test_paths, args, kwargs):
 
     path_pattern = tmp_path / "{a}/foo/"
     file_pattern = "{file_pattern}"
@@ -433,26 +485,13 @@ def test_find_file_none_found(tmp_path, test_paths):
     )
 
     with pytest.raises(ValueError, match="Found no files matching criteria"):
-        ff.find_files(a="XXX")
-
-    with pytest.raises(ValueError, match="Found no files matching criteria"):
-        ff.find_files({"a": "XXX"})
-
-    with pytest.warns(match="Found no files matching criteria"):
-        result = ff.find_files(a="XXX", on_empty="warn")
-    assert_filecontainer_empty(result, columns=("a", "file_pattern"))
+        ff.find_files(*args, **kwargs)
 
     with pytest.warns(match="Found no files matching criteria"):
-        result = ff.find_files({"a": "XXX"}, on_empty="warn")
-    assert_filecontainer_empty(result, columns=("a", "file_pattern"))
-
-    result = ff.find_files(a="XXX", on_empty="allow")
-    assert_filecontainer_empty(result, columns=("a", "file_pattern"))
-
-    result = ff.find_files({"a": "XXX"}, on_empty="allow")
+        result = ff.find_files(*args, on_empty="warn", **kwargs)
     assert_filecontainer_empty(result, columns=("a", "file_pattern"))
 
-    result = ff.find_files({"a": "XXX"}, on_empty="allow", a="XXX")
+    result = ff.find_files(*args, on_empty="allow", **kwargs)
     assert_filecontainer_empty(result, columns=("a", "file_pattern"))
 
 
@@ -475,8 +514,7 @@ def test_find_file_simple(tmp_path, test_paths):
         path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
     )
 
-    expected = {"path": {0: str(tmp_path / "a1/foo/file")}, "a": {0: "foo"}}
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    expected = create_df([str(tmp_path / "a1/foo/file")], a=["foo"])
 
     result = ff.find_files(a="foo")
     pd.testing.assert_frame_equal(result.df, expected)
@@ -489,95 +527,109 @@ def test_find_file_simple(tmp_path, test_paths):
 
 
 @pytest.mark.parametrize("find_kwargs", [{"b": "file"}, {"a": "*", "b": "file"}])
-def test_find_files_wildcard(tmp_path, test_paths, find_kwargs):
+def test_find_files_wildcard(tmp_path, ff_files, find_kwargs):
 
-    path_pattern = tmp_path / "{a}/foo"
-    file_pattern = "{b}"
-
-    ff = FileFinder(
-        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    expected = create_df(
+        [str(tmp_path / "a1/foo/file"), str(tmp_path / "a2/foo/file")],
+        a=["a1", "a2"],
+        b=["file", "file"],
     )
 
-    expected = {
-        "path": {
-            0: str(tmp_path / "a1/foo/file"),
-            1: str(tmp_path / "a2/foo/file"),
-        },
-        "a": {0: "a1", 1: "a2"},
-        "b": {0: "file", 1: "file"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
-
-    result = ff.find_files(**find_kwargs)
+    result = ff_files.find_files(**find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_files(find_kwargs)
+    result = ff_files.find_files(find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_files({"b": "XXX"}, **find_kwargs)
+    result = ff_files.find_files({"b": "XXX"}, **find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
 @pytest.mark.parametrize(
     "find_kwargs",
-    [{"a": ["a1", "a2"], "b": "file"}, {"a": ["a1", "a2"], "b": ["file", "bar"]}],
+    [
+        {"a": ["a1", "a2"], "b": "file"},
+        {"a": ["a1", "a2"], "b": ["file", "bar"]},
+        # the paths are sorted independent of the order of the values
+        {"a": ["a2", "a1"], "b": "file"},
+    ],
 )
-def test_find_files_several(tmp_path, test_paths, find_kwargs):
-
-    path_pattern = tmp_path / "{a}/foo"
-    file_pattern = "{b}"
+def test_find_files_several(tmp_path, ff_files, find_kwargs):
 
-    ff = FileFinder(
-        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    expected = create_df(
+        [str(tmp_path / "a1/foo/file"), str(tmp_path / "a2/foo/file")],
+        a=["a1", "a2"],
+        b=["file", "file"],
     )
 
-    expected = {
-        "path": {
-            0: str(tmp_path / "a1/foo/file"),
-            1: str(tmp_path / "a2/foo/file"),
-        },
-        "a": {0: "a1", 1: "a2"},
-        "b": {0: "file", 1: "file"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
-
-    result = ff.find_files(**find_kwargs)
+    result = ff_files.find_files(**find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_files(find_kwargs)
+    result = ff_files.find_files(find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_files({"a": "XXX", "b": "XXX"}, **find_kwargs)
+    result = ff_files.find_files({"a": "XXX", "b": "XXX"}, **find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
 @pytest.mark.parametrize(
-    "find_kwargs",
-    [{"a": "a1"}, {"a": "a1", "b": "file"}, {"a": "a1", "b": ["file", "bar"]}],
+    "find_kwargs", [{"b": ["f*", "x*"]}, {"a": "*", "b": ["f*", "x*"]}]
 )
-def test_find_files_one_of_several(tmp_path, test_paths, find_kwargs):
+def test_find_files_several_merged(tmp_path, ff_files, find_kwargs):
 
-    path_pattern = tmp_path / "{a}/foo"
-    file_pattern = "{b}"
+    expected = create_df(
+        [str(tmp_path / "a1/foo/file"), str(tmp_path / "a2/foo/file")],
+        a=["a1", "a2"],
+        b=["file", "file"],
+    )
 
-    ff = FileFinder(
-        path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
+    result = ff_files.find_files(**find_kwargs)
+    pd.testing.assert_frame_equal(result.df, expected)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_find_files_several_max_workers(tmp_path, ff_files, max_workers):
+
+    expected = create_df(
+        [str(tmp_path / "a1/foo/file"), str(tmp_path / "a2/foo/file")],
+        a=["a1", "a2"],
+        b=["file", "file"],
     )
 
-    expected = {
-        "path": {0: str(tmp_path / "a1/foo/file")},
-        "a": {0: "a1"},
-        "b": {0: "file"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    result = ff_files.find_files(a=["a1", "a2"], b="file", max_workers=max_workers)
+    pd.testing.assert_frame_equal(result.df, expected)
+
+
+@pytest.mark.parametrize(
+    "find_kwargs", [{"b": ["f*", "*"]}, {"a": ["a*", "*2"], "b": "file"}]
+)
+def test_find_files_several_overlapping(tmp_path, ff_files, find_kwargs):
+
+    expected = create_df(
+        [str(tmp_path / "a1/foo/file"), str(tmp_path / "a2/foo/file")],
+        a=["a1", "a2"],
+        b=["file", "file"],
+    )
+
+    result = ff_files.find_files(**find_kwargs)
+    pd.testing.assert_frame_equal(result.df, expected)
+
 
-    result = ff.find_files(**find_kwargs)
+@pytest.mark.parametrize(
+    "find_kwargs",
+    [{"a": "a1"}, {"a": "a1", "b": "file"}, {"a": "a1", "b": ["file", "bar"]}],
+)
+def test_find_files_one_of_several(tmp_path, ff_files, find_kwargs):
+
+    expected = create_df([str(tmp_path / "a1/foo/file")], a=["a1"], b=["file"])
+
+    result = ff_files.find_files(**find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_files(find_kwargs)
+    result = ff_files.find_files(find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
-    result = ff.find_files({"a": "XXX"}, **find_kwargs)
+    result = ff_files.find_files({"a": "XXX"}, **find_kwargs)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
@@ -598,8 +650,7 @@ def test_find_single_file(tmp_path, test_paths):
     with pytest.raises(ValueError, match="Found no files matching criteria"):
         ff.find_single_file(a="a3")
 
-    expected = {"path": {0: str(tmp_path / "a1/foo/file")}, "a": {0: "a1"}}
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    expected = create_df([str(tmp_path / "a1/foo/file")], a=["a1"])
 
     result = ff.find_single_file(a="a1")
     pd.testing.assert_frame_equal(result.df, expected)
@@ -608,27 +659,26 @@ def test_find_single_file(tmp_path, test_paths):
     pd.testing.assert_frame_equal(result.df, expected)
 
 
-def test_find_paths_scalar_number():
-
-    ff = FileFinder(
+@pytest.fixture(scope="module")
+def scalar_ff():
+    return FileFinder(
         path_pattern="{path}", file_pattern="{file}", test_paths=["1/1", "2/2"]
     )
 
+
+def test_find_paths_scalar_number(scalar_ff):
+
     index = pd.Index(["1/*"], name="path")
     expected = pd.DataFrame(["1"], columns=["path"], index=index)
-    result = ff.find_paths(path=1)
+    result = scalar_ff.find_paths(path=1)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
-def test_find_files_scalar_number():
-
-    ff = FileFinder(
-        path_pattern="{path}", file_pattern="{file}", test_paths=["1/1", "2/2"]
-    )
+def test_find_files_scalar_number(scalar_ff):
 
     index = pd.Index(["1/1"], name="path")
     expected = pd.DataFrame([["1", "1"]], columns=["path", "file"], index=index)
-    result = ff.find_files(file=1)
+    result = scalar_ff.find_files(file=1)
     pd.testing.assert_frame_equal(result.df, expected)
 
 
@@ -651,8 +701,7 @@ def test_find_unparsable():
     pd.testing.assert_frame_equal(result.df, expected)
 
     ff = FileFinder("{cat}", "{cat}", test_paths=["a/b", "a/a"])
-    expected = {"path": {0: "a/a"}, "cat": {0: "a"}}
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    expected = create_df(["a/a"], cat=["a"])
     result = ff.find_files(on_parse_error="ignore")
     pd.testing.assert_frame_equal(result.df, expected)
 
@@ -1,21 +1,9 @@
-import textwrap
-
 import pandas as pd
 import pytest
 
 from filefisher import FileFinder
 
-
-@pytest.fixture(scope="module", params=["from_filesystem", "from_string"])
-def test_paths(request, tmp_path):
-
-    if request.param == "from_filesystem":
-        return None
-
-    paths = ["a1/foo/file", "a2/foo/file"]
-    paths = [str(tmp_path / path) for path in paths]
-
-    return paths
+from . import create_df
 
 
 def test_pattern_no_fmt_spec():
@@ -56,14 +44,13 @@ def test_repr():
     file_pattern = "{b}_{c:d}"
     ff = FileFinder(path_pattern=path_pattern, file_pattern=file_pattern)
 
-    expected = """\
-    <FileFinder>
-    path_pattern: '/{a:l}/{b}/'
-    file_pattern: '{b}_{c:d}'
-
-    keys: 'a', 'b', 'c'
-    """
-    expected = textwrap.dedent(expected)
+    expected = (
+        "<FileFinder>\n"
+        "path_pattern: '/{a:l}/{b}/'\n"
+        "file_pattern: '{b}_{c:d}'\n"
+        "\n"
+        "keys: 'a', 'b', 'c'\n"
+    )
     assert expected == ff.__repr__()
 
 
@@ -110,17 +97,40 @@ def test_find_paths_fmt():
         path_pattern=path_pattern, file_pattern=file_pattern, test_paths=test_paths
     )
 
-    expected = {
-        "path": {0: "a1/a1_abc", 1: "ab200/ab200_aicdef"},
-        "letters": {0: "a", 1: "ab"},
-        "num": {0: 1, 1: 200},
-        "beg": {0: "ab", 1: "ai"},
-        "end": {0: "c", 1: "cdef"},
-    }
-    expected = pd.DataFrame.from_dict(expected).set_index("path")
+    expected = create_df(
+        ["a1/a1_abc", "ab200/ab200_aicdef"],
+        letters=["a", "ab"],
+        num=[1, 200],
+        beg=["ab", "ai"],
+        end=["c", "cdef"],
+    )
 
     result = ff.find_files()
     pd.testing.assert_frame_equal(result.df, expected)
 
     result = ff.find_files(num=[1])
     pd.testing.assert_frame_equal(result.df, expected.iloc[[0]])
+
+
+@pytest.mark.parametrize("fast_parse", (True, False))
+def test_find_files_typed_placeholder(fast_parse):
+
+    test_paths = ["a/2000_tas.nc", "a/2010_tas.nc", "b/2000_pr.nc"]
+
+    ff = FileFinder("{model}", "{year:d}_{var}.nc", test_paths=test_paths)
+
+    # test the fallback to parser.parse
+    ff.full._fast_parse = fast_parse
+
+    expected = create_df(
+        test_paths,
+        model=["a", "a", "b"],
+        year=[2000, 2010, 2000],
+        var=["tas", "tas", "pr"],
+    )
+
+    result = ff.find_files()
+    pd.testing.assert_frame_equal(result.df, expected)
+
+    result = ff.find_files(year=2010)
+    pd.testing.assert_frame_equal(result.df, expected.iloc[[1]])
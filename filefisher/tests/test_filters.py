@@ -81,6 +81,18 @@ def test_priority_filter_missing():
     pd.testing.assert_frame_equal(res, expected)
 
 
+def test_priority_filter_all_missing():
+
+    df = pd.DataFrame.from_records([("a", "z"), ("a", "x")], columns=("model", "res"))
+
+    expected = df.iloc[[]]
+
+    with assert_no_warnings():
+        result = priority_filter(df, "res", ["h", "d"], on_missing="ignore")
+
+    pd.testing.assert_frame_equal(result, expected)
+
+
 def test_priority_filter_duplicates():
 
     df = pd.DataFrame.from_records([("a", "d"), ("a", "d")], columns=("model", "res"))
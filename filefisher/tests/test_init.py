@@ -0,0 +1,52 @@
+import subprocess
+import sys
+
+import pytest
+
+import filefisher
+
+
+def test_import_does_not_import_pandas():
+
+    code = (
+        "import sys, filefisher; filefisher.__version__; print('pandas' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("name", filefisher.__all__)
+def test_lazy_attributes(name):
+
+    assert getattr(filefisher, name) is not None
+
+
+def test_dir():
+
+    names = dir(filefisher)
+    assert all(name in names for name in filefisher.__all__)
+
+    # before the lazy names are accessed
+    code = "import filefisher; print(sorted(set(filefisher.__all__) - set(dir(filefisher))))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_objects():
+
+    from filefisher._filefinder import FileContainer, FileFinder
+
+    assert filefisher.FileFinder is FileFinder
+    assert filefisher.FileContainer is FileContainer
+
+
+def test_missing_attribute():
+
+    with pytest.raises(AttributeError, match="has no attribute 'foo'"):
+        filefisher.foo
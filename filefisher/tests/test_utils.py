@@ -1,7 +1,12 @@
+import glob
+import os
+import sys
+
 import pytest
 
 from filefisher._utils import (
     _find_keys,
+    _scandir_glob,
     atoi,
     natural_keys,
     product_dict,
@@ -27,6 +32,17 @@ def test_find_keys(string, expected):
     assert result == expected
 
 
+def test_find_keys_interned():
+
+    # build the pattern at runtime so its substrings are not constants
+    string = "".join(["{var_", "name}/{year:d}"])
+
+    result = _find_keys(string)
+
+    assert result[0] is sys.intern("var_name")
+    assert result[1] is sys.intern("year")
+
+
 def test_atoi():
 
     assert atoi("10") == 10
@@ -67,9 +83,11 @@ def test_update_dict_with_kwargs():
     expected = {"a": 1, "b": 3, "c": 5}
     assert result == expected
 
-    result = update_dict_with_kwargs({"a": 1, "b": 2})
+    dictionary = {"a": 1, "b": 2}
+    result = update_dict_with_kwargs(dictionary)
     expected = {"a": 1, "b": 2}
     assert result == expected
+    assert result is not dictionary
 
     result = update_dict_with_kwargs(None, a=1, b=2)
     expected = {"a": 1, "b": 2}
@@ -83,3 +101,69 @@ def test_update_dict_with_kwargs():
 
     with pytest.raises(TypeError, match="missing 1 required positional argument"):
         update_dict_with_kwargs(dictionary={})
+
+
+@pytest.fixture(scope="module")
+def glob_path(tmp_path_factory):
+
+    tmp_path = tmp_path_factory.mktemp("glob")
+
+    for folder in ("a1/foo", "a2/foo", "a2/bar", ".hidden/foo"):
+        d = tmp_path / folder
+        d.mkdir(parents=True)
+        (d / "file").write_text("")
+        (d / ".file").write_text("")
+
+    (tmp_path / "a3").write_text("")
+    (tmp_path / "link").symlink_to(tmp_path / "a1", target_is_directory=True)
+
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    (
+        "*",
+        "*/",
+        "a*",
+        "a[12]/*",
+        "*/foo/file",
+        "*/*/",
+        "*/*/*",
+        "*/*/.*",
+        ".*/foo/file",
+        "a1/foo/file",
+        "a1/foo/",
+        "a1/foo/missing",
+        "a3/",
+        "missing/*/file",
+        "a?/b*/file",
+        "link/*/file",
+        "*//foo",
+        "*//foo/",
+        "*/foo//",
+        "*///foo/file",
+        "a1//*",
+        "a1//foo/*",
+        "a1//foo",
+    ),
+)
+@pytest.mark.parametrize("absolute", (True, False))
+def test_scandir_glob(glob_path, monkeypatch, pattern, absolute):
+
+    if absolute:
+        pattern = os.path.join(glob_path, pattern)
+    else:
+        monkeypatch.chdir(glob_path)
+
+    pattern = pattern.replace("/", os.sep)
+
+    result = sorted(_scandir_glob(pattern))
+    expected = sorted(glob.glob(pattern))
+
+    assert result == expected
+
+
+def test_scandir_glob_empty():
+
+    assert _scandir_glob("") == []